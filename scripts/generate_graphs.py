@@ -1,103 +1,153 @@
 #!/usr/bin/env python3
 """
 Generate benchmark comparison graphs from Go benchmark output.
-Replaces the Go implementation using matplotlib instead of go-echarts.
+Replaces the earlier Go implementation, which used go-echarts. Charts are
+written as SVG directly; matplotlib is an optional fallback renderer
+(--engine matplotlib).
 """
 
 import argparse
 import json
+import multiprocessing
+import os
 import re
+import shutil
 import sys
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import BinaryIO, Iterable, List, Dict, Optional, Tuple
+from xml.sax.saxutils import escape
 
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend for server environments
+import numpy as np
+
+# matplotlib.pyplot, imported by load_matplotlib() for the matplotlib engine
+plt = None
+
+# orjson is optional; it parses -json benchmark lines considerably faster
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# ijson is optional; it streams benchmark input given as one JSON array
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors raised for malformed JSON array input (orjson's and the stdlib's
+# decode errors are both ValueErrors; ijson's are not)
+JSON_INPUT_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
 
 # Color scheme matching the Go version
 GOHIVEX_COLOR = '#00ADD8'  # Official Go blue
 HIVEX_COLOR = '#808080'    # Neutral grey for C
 
+# Operations with high memory usage that pollute standard graphs
+MUTATION_OPERATIONS = frozenset({
+    'NodeAddChild', 'NodeSetValue', 'NodeSetValues', 'NodeDeleteChild',
+    'Commit', 'IntrospectionRecursive'
+})
+
+# Text benchmark line, e.g.:
+# BenchmarkNodeGetChild/gohivex/medium/abcd_äöüß-10  3456789  352.5 ns/op  160 B/op  7 allocs/op
+_TEXT_RE = re.compile(
+    r'^Benchmark(\w+)/(gohivex|hivex)/(\w+)(?:/(.+?))?-\d+\s+(\d+)\s+([\d.]+)\s+ns/op'
+    r'(?:\s+(\d+)\s+B/op)?(?:\s+(\d+)\s+allocs/op)?'
+)
+
 
 class BenchmarkResult:
     """Represents a parsed benchmark result."""
+    __slots__ = ('name', 'operation', 'hive_size', 'impl', 'iterations', 'ns_per_op',
+                 'bytes_per_op', 'allocs_per_op', 'operation_base', 'is_mutation')
+
     def __init__(self, name: str, operation: str, hive_size: str, impl: str,
                  iterations: int, ns_per_op: float, bytes_per_op: int, allocs_per_op: int):
         self.name = name
         self.operation = operation
-        self.hive_size = hive_size
-        self.impl = impl
+        # Low-cardinality fields are interned so all results share one string each
+        self.hive_size = sys.intern(hive_size)
+        self.impl = sys.intern(impl)
         self.iterations = iterations
         self.ns_per_op = ns_per_op
         self.bytes_per_op = bytes_per_op
         self.allocs_per_op = allocs_per_op
+        self.operation_base = sys.intern(operation.split('/', 1)[0])  # Handle "Operation/variant" format
+        self.is_mutation = self.operation_base in MUTATION_OPERATIONS
 
 
-class ComparisonResult:
-    """Represents a comparison between gohivex and hivex."""
-    def __init__(self, operation: str, hive_size: str):
-        self.operation = operation
-        self.hive_size = hive_size
-        self.gohivex_ns = 0.0
-        self.hivex_ns = 0.0
-        self.speedup = 0.0
-        self.gohivex_mem = 0
-        self.hivex_mem = 0
-        self.gohivex_allocs = 0
-        self.hivex_allocs = 0
-        self.gohivex_only = False
-
-    @property
-    def label(self) -> str:
-        """Generate display label for the comparison."""
-        if self.hive_size:
-            return f"{self.operation} ({self.hive_size})"
-        return self.operation
-
-
-def parse_json_benchmark(line: str) -> Optional[BenchmarkResult]:
+@dataclass
+class ComparisonTable:
+    """Comparisons between gohivex and hivex, one row per (operation, hive size).
+
+    Stored column-wise, one array per metric, so graphs can slice a metric
+    directly.
+    """
+    labels: List[str]
+    gohivex_ns: np.ndarray
+    hivex_ns: np.ndarray
+    speedup: np.ndarray
+    gohivex_mem: np.ndarray
+    hivex_mem: np.ndarray
+    gohivex_allocs: np.ndarray
+    hivex_allocs: np.ndarray
+    gohivex_only: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+def build_result_from_dict(data: dict) -> Optional[BenchmarkResult]:
+    """Build a benchmark result from a decoded JSON benchmark object."""
+    if not isinstance(data, dict):
+        return None
+
+    name = data.get('Name', '')
+    if not isinstance(name, str):
+        return None
+
+    # Parse name: Benchmark<Operation>/<impl>/<size>/<variant>
+    parts = name.split('/')
+    if len(parts) < 2:
+        return None
+
+    operation = parts[0].replace('Benchmark', '', 1)
+    impl = parts[1]
+    hive_size = parts[2] if len(parts) >= 3 else ''
+    variant = parts[3] if len(parts) >= 4 else ''
+
+    # Build display name
+    display_name = operation
+    if variant:
+        display_name = f"{operation}/{variant}"
+
+    return BenchmarkResult(
+        name=name,
+        operation=display_name,
+        hive_size=hive_size,
+        impl=impl,
+        iterations=data.get('N', 0),
+        ns_per_op=data.get('T', 0.0),
+        bytes_per_op=data.get('B', 0),
+        allocs_per_op=data.get('A', 0)
+    )
+
+
+def parse_json_benchmark(line: bytes) -> Optional[BenchmarkResult]:
     """Parse a JSON-formatted benchmark line."""
     try:
-        data = json.loads(line)
-        name = data.get('Name', '')
-
-        # Parse name: Benchmark<Operation>/<impl>/<size>/<variant>
-        parts = name.split('/')
-        if len(parts) < 2:
-            return None
-
-        operation = parts[0].replace('Benchmark', '', 1)
-        impl = parts[1]
-        hive_size = parts[2] if len(parts) >= 3 else ''
-        variant = parts[3] if len(parts) >= 4 else ''
-
-        # Build display name
-        display_name = operation
-        if variant:
-            display_name = f"{operation}/{variant}"
-
-        return BenchmarkResult(
-            name=name,
-            operation=display_name,
-            hive_size=hive_size,
-            impl=impl,
-            iterations=data.get('N', 0),
-            ns_per_op=data.get('T', 0.0),
-            bytes_per_op=data.get('B', 0),
-            allocs_per_op=data.get('A', 0)
-        )
+        return build_result_from_dict(_loads(line))
     except (json.JSONDecodeError, KeyError):
         return None
 
 
 def parse_text_benchmark(line: str) -> Optional[BenchmarkResult]:
     """Parse a text-formatted benchmark line."""
-    # Example: BenchmarkNodeGetChild/gohivex/medium/abcd_äöüß-10  3456789  352.5 ns/op  160 B/op  7 allocs/op
-    pattern = r'^Benchmark(\w+)/(gohivex|hivex)/(\w+)(?:/(.+?))?-\d+\s+(\d+)\s+([\d.]+)\s+ns/op(?:\s+(\d+)\s+B/op)?(?:\s+(\d+)\s+allocs/op)?'
-    match = re.match(pattern, line)
+    match = _TEXT_RE.match(line)
 
     if not match:
         return None
@@ -121,115 +171,357 @@ def parse_text_benchmark(line: str) -> Optional[BenchmarkResult]:
     )
 
 
-def parse_benchmarks(lines: List[str]) -> List[BenchmarkResult]:
-    """Parse benchmark results from input lines."""
+def parse_benchmarks(lines: Iterable[bytes]) -> List[BenchmarkResult]:
+    """Parse benchmark results from raw input lines, consumed lazily.
+
+    Lines may keep their trailing newline; neither parser needs it stripped.
+    Leading whitespace is ignored, so indented benchmark lines still parse.
+    """
     results = []
 
     for line in lines:
-        line = line.strip()
-        if not line:
-            continue
+        line = line.lstrip()
 
-        # Try JSON format first
-        if line.startswith('{'):
+        # Dispatch on a cheap prefix check so noise lines (PASS, ok, goos:,
+        # blank lines) never reach a parser. A '{' line that is not valid JSON
+        # cannot match the text format either, so it needs no fallback.
+        if line[:1] == b'{':
+            # JSON format, passed to the parser as raw bytes
             result = parse_json_benchmark(line)
-            if result:
-                results.append(result)
-                continue
+        elif line.startswith(b'Benchmark'):
+            result = parse_text_benchmark(line.decode('utf-8', errors='replace'))
+        else:
+            continue
+
+        if result:
+            results.append(result)
+
+    return results
 
-        # Try text format
-        result = parse_text_benchmark(line)
+
+def parse_json_array(stream: BinaryIO) -> List[BenchmarkResult]:
+    """Parse benchmark results from input holding a single JSON array.
+
+    Raises:
+        One of JSON_INPUT_ERRORS if the array is malformed
+    """
+    if ijson is not None:
+        items = ijson.items(stream, 'item', use_float=True)
+    else:
+        items = _loads(stream.read())
+
+    results = []
+    for data in items:
+        result = build_result_from_dict(data)
         if result:
             results.append(result)
 
     return results
 
 
-def generate_comparisons(results: List[BenchmarkResult],
-                         filter_type: str = 'standard') -> List[ComparisonResult]:
+def parse_input(stream: BinaryIO) -> List[BenchmarkResult]:
+    """Parse benchmark results from a binary input stream.
+
+    Input holding a JSON array is streamed item by item; anything else is
+    treated as line-oriented text or `go test -json` output.
+    """
+    # Skip leading whitespace until the first significant byte is buffered;
+    # a single peek() may only see a whitespace-only chunk of a pipe
+    head = stream.peek()
+    while head and not head.lstrip():
+        stream.read(len(head))
+        head = stream.peek()
+
+    if head.lstrip()[:1] == b'[':
+        return parse_json_array(stream)
+    return parse_benchmarks(stream)
+
+
+def generate_all_comparisons(results: List[BenchmarkResult]
+                             ) -> Tuple[ComparisonTable, ComparisonTable]:
     """Generate comparisons between gohivex and hivex implementations.
 
-    Args:
-        results: Parsed benchmark results
-        filter_type: 'standard' for regular ops, 'mutation' for write/recursive ops
+    Results are partitioned in a single pass into standard (read) operations
+    and mutation (write/recursive) operations, which are graphed separately.
+
+    Returns:
+        Tuple of (standard, mutation) comparison tables
     """
-    # Operations with high memory usage that pollute standard graphs
-    MUTATION_OPERATIONS = {
-        'NodeAddChild', 'NodeSetValue', 'NodeSetValues', 'NodeDeleteChild',
-        'Commit', 'IntrospectionRecursive'
-    }
-
-    # Group by operation and hive size
-    groups = defaultdict(list)
+    # Group by operation and hive size into [gohivex, hivex] slots
+    standard_groups = {}
+    mutation_groups = {}
     for result in results:
-        operation_base = result.operation.split('/')[0]  # Handle "Operation/variant" format
-        is_mutation = operation_base in MUTATION_OPERATIONS
-
-        # Filter based on type
-        if filter_type == 'standard' and is_mutation:
-            continue  # Skip mutations for standard graphs
-        elif filter_type == 'mutation' and not is_mutation:
-            continue  # Skip standard ops for mutation graphs
+        groups = mutation_groups if result.is_mutation else standard_groups
 
         key = (result.operation, result.hive_size)
-        groups[key].append(result)
+        slot = groups.get(key)
+        if slot is None:
+            slot = groups[key] = [None, None]
+
+        if result.impl == 'gohivex':
+            slot[0] = result
+        elif result.impl == 'hivex':
+            slot[1] = result
+
+    return build_comparison_table(standard_groups), build_comparison_table(mutation_groups)
+
+
+def build_comparison_table(groups: Dict[Tuple[str, str], List[Optional[BenchmarkResult]]]
+                           ) -> ComparisonTable:
+    """Build a sorted comparison table from [gohivex, hivex] result slots."""
+    labels = []
+    gohivex_ns = []
+    hivex_ns = []
+    speedup = []
+    gohivex_mem = []
+    hivex_mem = []
+    gohivex_allocs = []
+    hivex_allocs = []
+    gohivex_only = []
 
-    comparisons = []
-    for (operation, hive_size), group in groups.items():
-        gohivex = None
-        hivex = None
+    # Sort by operation name, then hive size
+    for key in sorted(groups):
+        operation, hive_size = key
+        gohivex, hivex = groups[key]
+
+        g_ns = gohivex.ns_per_op if gohivex else 0.0
+        h_ns = hivex.ns_per_op if hivex else 0.0
+
+        labels.append(f"{operation} ({hive_size})" if hive_size else operation)
+        gohivex_ns.append(g_ns)
+        hivex_ns.append(h_ns)
+        speedup.append(h_ns / g_ns if g_ns > 0 and h_ns > 0 else 0.0)
+        gohivex_mem.append(gohivex.bytes_per_op if gohivex else 0)
+        hivex_mem.append(hivex.bytes_per_op if hivex else 0)
+        gohivex_allocs.append(gohivex.allocs_per_op if gohivex else 0)
+        hivex_allocs.append(hivex.allocs_per_op if hivex else 0)
+        gohivex_only.append(gohivex is not None and hivex is None)
+
+    return ComparisonTable(
+        labels=labels,
+        gohivex_ns=np.array(gohivex_ns, dtype=np.float64),
+        hivex_ns=np.array(hivex_ns, dtype=np.float64),
+        speedup=np.array(speedup, dtype=np.float64),
+        gohivex_mem=np.array(gohivex_mem, dtype=np.int64),
+        hivex_mem=np.array(hivex_mem, dtype=np.int64),
+        gohivex_allocs=np.array(gohivex_allocs, dtype=np.int64),
+        hivex_allocs=np.array(hivex_allocs, dtype=np.int64),
+        gohivex_only=np.array(gohivex_only, dtype=np.bool_),
+    )
 
-        for result in group:
-            if result.impl == 'gohivex':
-                gohivex = result
-            elif result.impl == 'hivex':
-                hivex = result
 
-        comp = ComparisonResult(operation, hive_size)
+def load_matplotlib():
+    """Import matplotlib on first use; only the matplotlib engine needs it.
 
-        if gohivex:
-            comp.gohivex_ns = gohivex.ns_per_op
-            comp.gohivex_mem = gohivex.bytes_per_op
-            comp.gohivex_allocs = gohivex.allocs_per_op
+    The first call also renders a throwaway figure to load fonts and the Agg
+    renderer up front. Graph worker processes forked afterwards inherit the
+    loaded state instead of each paying for it on their first chart.
+    """
+    global plt
+    if plt is not None:
+        return plt
 
-        if hivex:
-            comp.hivex_ns = hivex.ns_per_op
-            comp.hivex_mem = hivex.bytes_per_op
-            comp.hivex_allocs = hivex.allocs_per_op
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-GUI backend for server environments
+    matplotlib.rcParams['svg.hashsalt'] = 'hivekit'  # Stable element ids in SVG output
+    import matplotlib.pyplot as pyplot
+    plt = pyplot
 
-        if gohivex and not hivex:
-            comp.gohivex_only = True
+    fig = plt.figure(figsize=(1, 1))
+    fig.text(0.5, 0.5, 'warm-up')
+    fig.canvas.draw()
+    plt.close(fig)
+    return plt
 
-        if comp.gohivex_ns > 0 and comp.hivex_ns > 0:
-            comp.speedup = comp.hivex_ns / comp.gohivex_ns
 
-        comparisons.append(comp)
+# Figures reused across charts, keyed by row count (which determines the size)
+_chart_figures: Dict[int, Tuple['plt.Figure', 'plt.Axes']] = {}
+
+
+def get_chart_axes(rows: int) -> 'plt.Axes':
+    """Return cleared axes on a figure sized for the given number of rows.
+
+    Figure setup dominates rendering for small charts, so one figure is kept
+    per row count and its axes are cleared between charts.
+    """
+    cached = _chart_figures.get(rows)
+    if cached is None:
+        height = max(8, rows * 0.25)
+        cached = _chart_figures[rows] = load_matplotlib().subplots(figsize=(16, height))
+    fig, ax = cached
+    ax.clear()
+    return ax
+
+
+def page_path(path: Path, page: int) -> Path:
+    """Return the output path for a chart page (the first page keeps the name)."""
+    if page == 1:
+        return path
+    return path.with_name(f"{path.stem}_p{page}{path.suffix}")
+
+
+def remove_stale_pages(path: Path, pages: int):
+    """Delete page files beyond the given page count left by earlier runs."""
+    for stale in path.parent.glob(f"{path.stem}_p*{path.suffix}"):
+        page = stale.stem[len(path.stem) + 2:]
+        if page.isdigit() and int(page) > pages:
+            stale.unlink()
 
-    # Sort by operation name, then hive size
-    comparisons.sort(key=lambda c: (c.operation, c.hive_size))
 
-    return comparisons
+def link_or_copy(src: Path, dst: Path):
+    """Hardlink src to dst, falling back to a copy (e.g. across filesystems)."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
 
-def create_horizontal_bar_chart(comparisons: List[ComparisonResult],
+def create_horizontal_bar_chart(comparisons: ComparisonTable,
                                 title: str, subtitle: str,
-                                gohivex_values: List[float],
-                                hivex_values: List[float],
+                                gohivex_values: np.ndarray,
+                                hivex_values: np.ndarray,
+                                output_path: Path,
+                                max_rows: int = 0,
+                                engine: str = 'svg') -> int:
+    """Create a horizontal bar chart comparing gohivex and hivex.
+
+    Charts with more than max_rows comparisons are split into evenly sized
+    pages, written to page_path(output_path, n). A max_rows of 0 disables
+    paging.
+
+    Args:
+        engine: 'svg' to write SVG directly, 'matplotlib' to render with
+            matplotlib (format follows the output_path extension)
+
+    Returns:
+        Number of pages written
+    """
+    render = write_svg_barh if engine == 'svg' else render_horizontal_bar_chart
+
+    rows = len(comparisons)
+    pages = -(-rows // max_rows) if max_rows and rows > max_rows else 1
+    page_rows = -(-rows // pages)
+
+    for page in range(1, pages + 1):
+        start = (page - 1) * page_rows
+        end = start + page_rows
+        page_subtitle = f"{subtitle} (page {page}/{pages})" if pages > 1 else subtitle
+        render(comparisons.labels[start:end], title, page_subtitle,
+               gohivex_values[start:end], hivex_values[start:end],
+               page_path(output_path, page))
+
+    return pages
+
+
+def nice_ticks(max_value: float, target: int = 8) -> Tuple[np.ndarray, int]:
+    """Return round-numbered axis ticks from 0 covering max_value.
+
+    Returns:
+        Tuple of (tick values, decimal places needed to label them)
+    """
+    if max_value <= 0:
+        return np.array([0.0, 1.0]), 0
+
+    raw_step = max_value / target
+    magnitude = 10.0 ** np.floor(np.log10(raw_step))
+    for multiple in (1, 2, 5, 10):
+        step = multiple * magnitude
+        if step >= raw_step:
+            break
+
+    count = int(np.ceil(max_value / step - 1e-9))
+    decimals = max(0, -int(np.floor(np.log10(step))))
+    return np.arange(count + 1) * step, decimals
+
+
+def write_svg_barh(labels: List[str], title: str, subtitle: str,
+                   gohivex_values: np.ndarray,
+                   hivex_values: np.ndarray,
+                   output_path: Path):
+    """Write a horizontal bar chart as SVG without going through matplotlib."""
+    rows = len(labels)
+    width = 1600
+
+    # Size the label margin at ~7px per character, capped at half the chart;
+    # labels too long for the capped margin are truncated
+    max_label_chars = (width // 2 - 40) // 7
+    labels = [label if len(label) <= max_label_chars else label[:max_label_chars - 1] + '…'
+              for label in labels]
+    left = 40 + 7 * max((len(label) for label in labels), default=0)
+    top, right, bottom = 90, 30, 50
+    plot_width = width - left - right
+    plot_height = max(700, rows * 25)
+    height = top + plot_height + bottom
+    row_height = plot_height / max(rows, 1)
+    bar_height = 0.35 * row_height
+
+    ticks, decimals = nice_ticks(float(max(np.max(gohivex_values, initial=0),
+                                           np.max(hivex_values, initial=0))))
+    scale = plot_width / ticks[-1]
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                f'viewBox="0 0 {width} {height}" font-family="DejaVu Sans, Arial, sans-serif">\n'
+                f'<rect width="{width}" height="{height}" fill="#ffffff"/>\n'
+                f'<text x="{left + plot_width / 2:.1f}" y="32" font-size="18" text-anchor="middle">'
+                f'{escape(title)}</text>\n'
+                f'<text x="{left + plot_width / 2:.1f}" y="56" font-size="18" text-anchor="middle">'
+                f'{escape(subtitle)}</text>\n')
+
+        # Vertical grid lines with x-axis tick labels
+        axis_y = top + plot_height
+        for tick in ticks:
+            x = left + tick * scale
+            f.write(f'<line x1="{x:.1f}" y1="{top}" x2="{x:.1f}" y2="{axis_y}" '
+                    f'stroke="#b0b0b0" stroke-opacity="0.3"/>\n'
+                    f'<text x="{x:.1f}" y="{axis_y + 22}" font-size="12" text-anchor="middle">'
+                    f'{tick:,.{decimals}f}</text>\n')
+
+        # One row per comparison, labels read top-to-bottom
+        for i, label in enumerate(labels):
+            center = top + (i + 0.5) * row_height
+            f.write(f'<rect x="{left}" y="{center - bar_height:.1f}" '
+                    f'width="{gohivex_values[i] * scale:.1f}" height="{bar_height:.1f}" '
+                    f'fill="{GOHIVEX_COLOR}"/>\n'
+                    f'<rect x="{left}" y="{center:.1f}" '
+                    f'width="{hivex_values[i] * scale:.1f}" height="{bar_height:.1f}" '
+                    f'fill="{HIVEX_COLOR}"/>\n'
+                    f'<text x="{left - 8}" y="{center:.1f}" font-size="12" text-anchor="end" '
+                    f'dominant-baseline="middle">{escape(label)}</text>\n')
+
+        # Plot frame and legend
+        legend_x = left + plot_width - 130
+        f.write(f'<rect x="{left}" y="{top}" width="{plot_width}" height="{plot_height}" '
+                f'fill="none" stroke="#000000"/>\n'
+                f'<rect x="{legend_x}" y="{top + 10}" width="120" height="52" fill="#ffffff" '
+                f'fill-opacity="0.8" stroke="#cccccc" rx="3"/>\n'
+                f'<rect x="{legend_x + 10}" y="{top + 19}" width="28" height="12" '
+                f'fill="{GOHIVEX_COLOR}"/>\n'
+                f'<text x="{legend_x + 46}" y="{top + 30}" font-size="13">gohivex</text>\n'
+                f'<rect x="{legend_x + 10}" y="{top + 41}" width="28" height="12" '
+                f'fill="{HIVEX_COLOR}"/>\n'
+                f'<text x="{legend_x + 46}" y="{top + 52}" font-size="13">hivex</text>\n'
+                '</svg>\n')
+
+
+def render_horizontal_bar_chart(labels: List[str], title: str, subtitle: str,
+                                gohivex_values: np.ndarray,
+                                hivex_values: np.ndarray,
                                 output_path: Path):
-    """Create a horizontal bar chart comparing gohivex and hivex."""
-    # Calculate figure size based on number of comparisons
-    height = max(8, len(comparisons) * 0.25)
-    fig, ax = plt.subplots(figsize=(16, height))
+    """Render a single horizontal bar chart image with matplotlib."""
+    # Figure size is based on number of comparisons
+    ax = get_chart_axes(len(labels))
+    fig = ax.figure
 
     # Prepare data
-    labels = [comp.label for comp in comparisons]
-    y_pos = range(len(labels))
+    y_pos = np.arange(len(labels))
 
     # Create horizontal bars
     bar_height = 0.35
-    ax.barh([y - bar_height/2 for y in y_pos], gohivex_values, bar_height,
+    ax.barh(y_pos - bar_height/2, gohivex_values, bar_height,
             label='gohivex', color=GOHIVEX_COLOR)
-    ax.barh([y + bar_height/2 for y in y_pos], hivex_values, bar_height,
+    ax.barh(y_pos + bar_height/2, hivex_values, bar_height,
             label='hivex', color=HIVEX_COLOR)
 
     # Customize chart
@@ -241,107 +533,85 @@ def create_horizontal_bar_chart(comparisons: List[ComparisonResult],
     ax.grid(axis='x', alpha=0.3)
 
     # Adjust layout to prevent label cutoff
-    plt.tight_layout()
+    fig.tight_layout()
 
-    # Save to file
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    # Save to file; the format follows the file extension
+    if output_path.suffix == '.svg':
+        # Omit the creation date so regenerated docs images only change with the data
+        fig.savefig(output_path, bbox_inches='tight', metadata={'Date': None})
+    else:
+        fig.savefig(output_path, dpi=150, bbox_inches='tight')
 
 
-def generate_time_graph(comparisons: List[ComparisonResult], output_dir: Path,
-                        timestamp: str, prefix: str = '', docs_dir: Path = None):
-    """Generate time comparison graph."""
-    gohivex_values = [comp.gohivex_ns for comp in comparisons]
-    hivex_values = [0 if comp.gohivex_only else comp.hivex_ns for comp in comparisons]
-
-    # Timestamped version for history
-    filename = f"{timestamp}_{prefix}time.png" if prefix else f"{timestamp}_time.png"
-    output_path = output_dir / filename
-    create_horizontal_bar_chart(
-        comparisons,
-        "Performance Comparison (ns/op)",
-        "gohivex vs hivex - Lower is Better",
-        gohivex_values,
-        hivex_values,
-        output_path
-    )
+def write_graph(comparisons: ComparisonTable, name: str, title: str,
+                gohivex_values: np.ndarray, hivex_values: np.ndarray,
+                output_dir: Path, timestamp: str, prefix: str = '',
+                docs_dir: Path = None, max_rows: int = 0, engine: str = 'svg'):
+    """Write the timestamped and documentation images for one graph."""
+    subtitle = "gohivex vs hivex - Lower is Better"
+
+    # Timestamped version for history (PNG when rendering with matplotlib)
+    extension = 'svg' if engine == 'svg' else 'png'
+    output_path = output_dir / f"{timestamp}_{prefix}{name}.{extension}"
+    pages = create_horizontal_bar_chart(comparisons, title, subtitle, gohivex_values,
+                                        hivex_values, output_path, max_rows, engine)
+    remove_stale_pages(output_path, pages)
 
-    # Static version for documentation
+    # Static SVG version for documentation
     if docs_dir:
-        static_filename = f"{prefix}time.png" if prefix else "time.png"
-        docs_path = docs_dir / static_filename
-        create_horizontal_bar_chart(
-            comparisons,
-            "Performance Comparison (ns/op)",
-            "gohivex vs hivex - Lower is Better",
-            gohivex_values,
-            hivex_values,
-            docs_path
-        )
-
-
-def generate_memory_graph(comparisons: List[ComparisonResult], output_dir: Path,
-                          timestamp: str, prefix: str = '', docs_dir: Path = None):
+        docs_path = docs_dir / f"{prefix}{name}.svg"
+        remove_stale_pages(docs_path, pages)
+        if engine == 'svg':
+            # The images are identical, so link them rather than writing again
+            for page in range(1, pages + 1):
+                link_or_copy(page_path(output_path, page), page_path(docs_path, page))
+        else:
+            # An SVG-engine run may have left the docs pages hardlinked to its
+            # history images; unlink them so rendering in place cannot
+            # overwrite those
+            for page in range(1, pages + 1):
+                page_path(docs_path, page).unlink(missing_ok=True)
+            # Vector output skips rasterization and renders sharply in docs
+            create_horizontal_bar_chart(comparisons, title, subtitle, gohivex_values,
+                                        hivex_values, docs_path, max_rows, engine)
+
+
+def generate_time_graph(comparisons: ComparisonTable, output_dir: Path,
+                        timestamp: str, prefix: str = '', docs_dir: Path = None,
+                        max_rows: int = 0, engine: str = 'svg'):
+    """Generate time comparison graph."""
+    write_graph(comparisons, 'time', "Performance Comparison (ns/op)",
+                comparisons.gohivex_ns,
+                np.where(comparisons.gohivex_only, 0, comparisons.hivex_ns),
+                output_dir, timestamp, prefix, docs_dir, max_rows, engine)
+
+
+def generate_memory_graph(comparisons: ComparisonTable, output_dir: Path,
+                          timestamp: str, prefix: str = '', docs_dir: Path = None,
+                          max_rows: int = 0, engine: str = 'svg'):
     """Generate memory comparison graph."""
-    gohivex_values = [comp.gohivex_mem for comp in comparisons]
-    hivex_values = [0 if comp.gohivex_only else comp.hivex_mem for comp in comparisons]
-
-    # Timestamped version for history
-    filename = f"{timestamp}_{prefix}memory.png" if prefix else f"{timestamp}_memory.png"
-    output_path = output_dir / filename
-    create_horizontal_bar_chart(
-        comparisons,
-        "Memory Usage Comparison (B/op)",
-        "gohivex vs hivex - Lower is Better",
-        gohivex_values,
-        hivex_values,
-        output_path
-    )
+    write_graph(comparisons, 'memory', "Memory Usage Comparison (B/op)",
+                comparisons.gohivex_mem,
+                np.where(comparisons.gohivex_only, 0, comparisons.hivex_mem),
+                output_dir, timestamp, prefix, docs_dir, max_rows, engine)
 
-    # Static version for documentation
-    if docs_dir:
-        static_filename = f"{prefix}memory.png" if prefix else "memory.png"
-        docs_path = docs_dir / static_filename
-        create_horizontal_bar_chart(
-            comparisons,
-            "Memory Usage Comparison (B/op)",
-            "gohivex vs hivex - Lower is Better",
-            gohivex_values,
-            hivex_values,
-            docs_path
-        )
-
-
-def generate_allocations_graph(comparisons: List[ComparisonResult], output_dir: Path,
-                               timestamp: str, prefix: str = '', docs_dir: Path = None):
+
+def generate_allocations_graph(comparisons: ComparisonTable, output_dir: Path,
+                               timestamp: str, prefix: str = '', docs_dir: Path = None,
+                               max_rows: int = 0, engine: str = 'svg'):
     """Generate allocations comparison graph."""
-    gohivex_values = [comp.gohivex_allocs for comp in comparisons]
-    hivex_values = [0 if comp.gohivex_only else comp.hivex_allocs for comp in comparisons]
-
-    # Timestamped version for history
-    filename = f"{timestamp}_{prefix}allocations.png" if prefix else f"{timestamp}_allocations.png"
-    output_path = output_dir / filename
-    create_horizontal_bar_chart(
-        comparisons,
-        "Allocations Comparison (allocs/op)",
-        "gohivex vs hivex - Lower is Better",
-        gohivex_values,
-        hivex_values,
-        output_path
-    )
+    write_graph(comparisons, 'allocations', "Allocations Comparison (allocs/op)",
+                comparisons.gohivex_allocs,
+                np.where(comparisons.gohivex_only, 0, comparisons.hivex_allocs),
+                output_dir, timestamp, prefix, docs_dir, max_rows, engine)
 
-    # Static version for documentation
-    if docs_dir:
-        static_filename = f"{prefix}allocations.png" if prefix else "allocations.png"
-        docs_path = docs_dir / static_filename
-        create_horizontal_bar_chart(
-            comparisons,
-            "Allocations Comparison (allocs/op)",
-            "gohivex vs hivex - Lower is Better",
-            gohivex_values,
-            hivex_values,
-            docs_path
-        )
+
+def non_negative_int(value: str) -> int:
+    """argparse type for integer options that must not be negative."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
 
 
 def main():
@@ -350,41 +620,42 @@ def main():
     )
     parser.add_argument('--input', type=str, default='',
                        help='Input file with benchmark JSON output (stdin if not specified)')
-    parser.add_argument('--output', type=str, default='benchmarks/graphs/png',
-                       help='Output directory for PNG graphs')
+    parser.add_argument('--output', type=str, default='benchmarks/graphs',
+                       help='Output directory for timestamped graphs')
     parser.add_argument('--docs-dir', type=str, default='docs/images',
-                       help='Output directory for static documentation images (default: docs/images)')
+                       help='Output directory for static SVG documentation images (default: docs/images)')
     parser.add_argument('--timestamp', type=str, default='',
                        help='Timestamp for output files (auto-generated if not specified)')
+    parser.add_argument('--max-rows-per-chart', type=non_negative_int, default=100,
+                       help='Split charts with more comparisons into pages (0 disables paging)')
+    parser.add_argument('--engine', choices=('svg', 'matplotlib'), default='svg',
+                       help='Chart renderer: built-in SVG writer, or matplotlib for PNG history images')
     parser.add_argument('--quiet', action='store_true',
                        help='Suppress progress output')
 
     args = parser.parse_args()
 
-    # Read input
-    if args.input:
-        try:
-            with open(args.input, 'r') as f:
-                lines = f.readlines()
-        except IOError as e:
-            print(f"Error opening input file: {e}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        lines = sys.stdin.readlines()
-
-    # Parse benchmarks
-    results = parse_benchmarks(lines)
+    # Stream and parse benchmarks
+    try:
+        if args.input:
+            try:
+                with open(args.input, 'rb') as f:
+                    results = parse_input(f)
+            except IOError as e:
+                print(f"Error opening input file: {e}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            results = parse_input(sys.stdin.buffer)
+    except JSON_INPUT_ERRORS as e:
+        print(f"Error parsing input: {e}", file=sys.stderr)
+        sys.exit(1)
     if not args.quiet:
         print(f"Parsed {len(results)} benchmark results", file=sys.stderr)
 
-    # Generate standard comparisons (read operations)
-    standard_comparisons = generate_comparisons(results, filter_type='standard')
+    # Generate standard (read) and mutation (write/recursive) comparisons
+    standard_comparisons, mutation_comparisons = generate_all_comparisons(results)
     if not args.quiet:
         print(f"Generated {len(standard_comparisons)} standard comparisons", file=sys.stderr)
-
-    # Generate mutation comparisons (write/recursive operations)
-    mutation_comparisons = generate_comparisons(results, filter_type='mutation')
-    if not args.quiet:
         print(f"Generated {len(mutation_comparisons)} mutation comparisons", file=sys.stderr)
 
     # Generate timestamp if not provided
@@ -398,29 +669,53 @@ def main():
     docs_dir = Path(args.docs_dir)
     docs_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate standard graphs
-    try:
-        if standard_comparisons:
-            generate_time_graph(standard_comparisons, output_dir, timestamp, docs_dir=docs_dir)
-            generate_memory_graph(standard_comparisons, output_dir, timestamp, docs_dir=docs_dir)
-            generate_allocations_graph(standard_comparisons, output_dir, timestamp, docs_dir=docs_dir)
-            if not args.quiet:
-                print(f"Generated standard graphs ({len(standard_comparisons)} ops)", file=sys.stderr)
-    except Exception as e:
-        print(f"Error generating standard graphs: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Generate mutation graphs (separate set with different scales)
-    try:
-        if mutation_comparisons:
-            generate_time_graph(mutation_comparisons, output_dir, timestamp, prefix='mutation_', docs_dir=docs_dir)
-            generate_memory_graph(mutation_comparisons, output_dir, timestamp, prefix='mutation_', docs_dir=docs_dir)
-            generate_allocations_graph(mutation_comparisons, output_dir, timestamp, prefix='mutation_', docs_dir=docs_dir)
-            if not args.quiet:
-                print(f"Generated mutation graphs ({len(mutation_comparisons)} ops)", file=sys.stderr)
-    except Exception as e:
-        print(f"Error generating mutation graphs: {e}", file=sys.stderr)
-        sys.exit(1)
+    # Standard graphs, plus mutation graphs as a separate set with different scales
+    graph_sets = [
+        ('standard', standard_comparisons, ''),
+        ('mutation', mutation_comparisons, 'mutation_'),
+    ]
+    generators = (generate_time_graph, generate_memory_graph, generate_allocations_graph)
+    graph_options = dict(docs_dir=docs_dir, max_rows=args.max_rows_per_chart, engine=args.engine)
+
+    if args.engine == 'matplotlib':
+        # Graphs are independent, so matplotlib renders them in worker processes
+        # (loaded first so forked workers inherit it). macOS cannot safely fork
+        # a process that has initialized matplotlib.
+        load_matplotlib()
+        mp_context = multiprocessing.get_context('spawn') if sys.platform == 'darwin' else None
+        with ProcessPoolExecutor(mp_context=mp_context) as executor:
+            futures = {
+                name: [executor.submit(generator, comparisons, output_dir, timestamp,
+                                       prefix=prefix, **graph_options)
+                       for generator in generators]
+                for name, comparisons, prefix in graph_sets if comparisons
+            }
+
+            for name, comparisons, _ in graph_sets:
+                if name not in futures:
+                    continue
+                try:
+                    for future in futures[name]:
+                        future.result()
+                    if not args.quiet:
+                        print(f"Generated {name} graphs ({len(comparisons)} ops)", file=sys.stderr)
+                except Exception as e:
+                    print(f"Error generating {name} graphs: {e}", file=sys.stderr)
+                    executor.shutdown(cancel_futures=True)
+                    sys.exit(1)
+    else:
+        # The SVG writer is cheaper than starting workers, so it runs inline
+        for name, comparisons, prefix in graph_sets:
+            if not comparisons:
+                continue
+            try:
+                for generator in generators:
+                    generator(comparisons, output_dir, timestamp, prefix=prefix, **graph_options)
+                if not args.quiet:
+                    print(f"Generated {name} graphs ({len(comparisons)} ops)", file=sys.stderr)
+            except Exception as e:
+                print(f"Error generating {name} graphs: {e}", file=sys.stderr)
+                sys.exit(1)
 
     if not args.quiet:
         print(f"All graphs generated in {output_dir}", file=sys.stderr)
@@ -192,9 +192,9 @@ check_dependencies() {
         exit 1
     fi
 
-    # Check for matplotlib in venv
-    if ! "$PROJECT_ROOT/venv/bin/python3" -c "import matplotlib" &> /dev/null; then
-        log_error "matplotlib is not installed in virtual environment"
+    # Check for numpy in venv (graphs are written as SVG; matplotlib is optional)
+    if ! "$PROJECT_ROOT/venv/bin/python3" -c "import numpy" &> /dev/null; then
+        log_error "numpy is not installed in virtual environment"
         log_error "Run: make install-python-deps"
         exit 1
     fi
@@ -283,7 +283,7 @@ run_benchmarks() {
     local timestamp=$(basename "$OUTPUT_FILE" | sed -E 's/^([0-9]{4}-[0-9]{2}-[0-9]{2}_[0-9]{6}).*$/\1/')
 
     # Use absolute paths for output directories
-    local graphs_output="$PROJECT_ROOT/benchmarks/graphs/png"
+    local graphs_output="$PROJECT_ROOT/benchmarks/graphs"
     local docs_output="$PROJECT_ROOT/docs/images"
 
     if "$PROJECT_ROOT/venv/bin/python3" "$SCRIPT_DIR/generate_graphs.py" --input="$temp_output" --output="$graphs_output" --docs-dir="$docs_output" --timestamp="$timestamp" 2>&1; then
@@ -109,8 +109,8 @@ update_benchmarks() {
         return 0
     fi
 
-    # Find all PNG files in the docs images directory (static versions)
-    BENCHMARK_IMAGES=$(find "$DOCS_IMAGES_DIR" -name "*.png" -type f | sort)
+    # Find all SVG files in the docs images directory (static versions)
+    BENCHMARK_IMAGES=$(find "$DOCS_IMAGES_DIR" -name "*.svg" -type f | sort)
 
     if [ -z "$BENCHMARK_IMAGES" ]; then
         log_warn "No benchmark images found in $DOCS_IMAGES_DIR"
@@ -125,28 +125,32 @@ update_benchmarks() {
     BENCHMARK_MD="${BENCHMARK_MD}Read operations and basic traversal:\n\n"
 
     # Add standard operation graphs
-    for img_name in "time.png" "memory.png" "allocations.png"; do
-        img="${DOCS_IMAGES_DIR}/${img_name}"
-        if [ -f "$img" ]; then
-            REL_PATH="$(realpath --relative-to="$REPO_ROOT" "$img" 2>/dev/null || python3 -c "import os; print(os.path.relpath('$img', '$REPO_ROOT'))")"
-            BASENAME=$(basename "$img" .png)
-            TITLE=$(echo "$BASENAME" | sed 's/_/ /g' | sed 's/\b\(.\)/\u\1/g')
-            BENCHMARK_MD="${BENCHMARK_MD}![${TITLE}](${REL_PATH})\n\n"
-        fi
+    # (charts split into pages add <name>_p2.svg, <name>_p3.svg, ...)
+    for img_name in "time" "memory" "allocations"; do
+        for img in "${DOCS_IMAGES_DIR}/${img_name}.svg" $(ls -v "${DOCS_IMAGES_DIR}/${img_name}"_p*.svg 2>/dev/null); do
+            if [ -f "$img" ]; then
+                REL_PATH="$(realpath --relative-to="$REPO_ROOT" "$img" 2>/dev/null || python3 -c "import os; print(os.path.relpath('$img', '$REPO_ROOT'))")"
+                BASENAME=$(basename "$img" .svg | sed 's/_p\([0-9]*\)$/ (page \1)/')
+                TITLE=$(echo "$BASENAME" | sed 's/_/ /g' | sed 's/\b\(.\)/\u\1/g')
+                BENCHMARK_MD="${BENCHMARK_MD}![${TITLE}](${REL_PATH})\n\n"
+            fi
+        done
     done
 
     BENCHMARK_MD="${BENCHMARK_MD}### Mutation Operations\n\n"
     BENCHMARK_MD="${BENCHMARK_MD}Write operations and recursive traversal:\n\n"
 
     # Add mutation operation graphs
-    for img_name in "mutation_time.png" "mutation_memory.png" "mutation_allocations.png"; do
-        img="${DOCS_IMAGES_DIR}/${img_name}"
-        if [ -f "$img" ]; then
-            REL_PATH="$(realpath --relative-to="$REPO_ROOT" "$img" 2>/dev/null || python3 -c "import os; print(os.path.relpath('$img', '$REPO_ROOT'))")"
-            BASENAME=$(basename "$img" .png)
-            TITLE=$(echo "$BASENAME" | sed 's/mutation_//g' | sed 's/_/ /g' | sed 's/\b\(.\)/\u\1/g')
-            BENCHMARK_MD="${BENCHMARK_MD}![Mutation ${TITLE}](${REL_PATH})\n\n"
-        fi
+    # (charts split into pages add <name>_p2.svg, <name>_p3.svg, ...)
+    for img_name in "mutation_time" "mutation_memory" "mutation_allocations"; do
+        for img in "${DOCS_IMAGES_DIR}/${img_name}.svg" $(ls -v "${DOCS_IMAGES_DIR}/${img_name}"_p*.svg 2>/dev/null); do
+            if [ -f "$img" ]; then
+                REL_PATH="$(realpath --relative-to="$REPO_ROOT" "$img" 2>/dev/null || python3 -c "import os; print(os.path.relpath('$img', '$REPO_ROOT'))")"
+                BASENAME=$(basename "$img" .svg | sed 's/_p\([0-9]*\)$/ (page \1)/')
+                TITLE=$(echo "$BASENAME" | sed 's/mutation_//g' | sed 's/_/ /g' | sed 's/\b\(.\)/\u\1/g')
+                BENCHMARK_MD="${BENCHMARK_MD}![Mutation ${TITLE}](${REL_PATH})\n\n"
+            fi
+        done
     done
 
     BENCHMARK_MD="${BENCHMARK_MD}Run \`make benchmark-compare\` to generate updated benchmark results."